@@ -118,9 +118,10 @@ def get_face_to_face_index(faces, edges):
 
     return face_to_face
 
-def get_constraint_pairs(face_to_face, face_set):
+def get_constraint_pairs(face_to_face, face_list):
+    face_set = frozenset(face_list)
     pairs = []
-    for index in face_set:
+    for index in face_list:
         for adj in face_to_face[index]:
             if adj in face_set:
                 pairs.append((index, adj))
@@ -146,6 +147,11 @@ class uCRM_VonMisesMassMin:
         self.nvars = num_components
         self.x = np.zeros(self.nvars)
 
+        # Storage for the objective and constraint gradients
+        self.gx = np.zeros(self.nvars, TACS.dtype)
+        self.dfdx = np.zeros(self.nvars, TACS.dtype)
+        self.product = np.zeros(self.nvars, TACS.dtype)
+
         # The number of constraints (1 global stress constraint that
         # will use the KS function)
         self.ncon = 1
@@ -153,6 +159,9 @@ class uCRM_VonMisesMassMin:
         # Set the iteration counter
         self.iter_count = 0
 
+        # Write out intermediate solution files during optimization
+        self.write_output = True
+
         return
 
     def setAssembler(self, assembler, ksfunc):
@@ -186,17 +195,20 @@ class uCRM_VonMisesMassMin:
         '''Set the values of the bounds'''
         xvals = np.zeros(self.nvars, TACS.dtype)
         self.assembler.getDesignVars(xvals)
-        xvals[:] = self.thickness_scale*xvals
 
-        xlb = 1e20*np.ones(self.nvars, TACS.dtype)
-        xub = -1e20*np.ones(self.nvars, TACS.dtype)
+        xlb = np.full(self.nvars, 1e20, TACS.dtype)
+        xub = np.full(self.nvars, -1e20, TACS.dtype)
         self.assembler.getDesignVarRange(xlb, xub)
-        xlb[:] = self.thickness_scale*xlb
-        xub[:] = self.thickness_scale*xub
 
-        self.comm.Allreduce(xvals, x, op=MPI.MAX)
-        self.comm.Allreduce(xlb, lb, op=MPI.MIN)
-        self.comm.Allreduce(xub, ub, op=MPI.MAX)
+        # Reduce the values and bounds in a single call. The minimum of
+        # the lower bounds is the negative of the maximum of -xlb.
+        data = np.vstack((xvals, xub, -xlb))
+        data *= self.thickness_scale
+        self.comm.Allreduce(MPI.IN_PLACE, data, op=MPI.MAX)
+
+        x[:] = data[0]
+        ub[:] = data[1]
+        lb[:] = -data[2]
 
         return
 
@@ -248,13 +260,16 @@ class uCRM_VonMisesMassMin:
 
         # Evaluate the derivative of the mass and place it in the
         # objective gradient
-        gx = np.zeros(self.nvars, TACS.dtype)
+        gx = self.gx
+        gx.fill(0.0)
         self.assembler.evalDVSens(self.funcs[0], gx)
-        gx[:] *= self.mass_scale/self.thickness_scale
+        gx *= self.mass_scale/self.thickness_scale
 
         # Compute the total derivative w.r.t. material design variables
-        dfdx = np.zeros(self.nvars, TACS.dtype)
-        product = np.zeros(self.nvars, TACS.dtype)
+        dfdx = self.dfdx
+        product = self.product
+        dfdx.fill(0.0)
+        product.fill(0.0)
 
         # Compute the derivative of the function w.r.t. the state
         # variables
@@ -267,10 +282,11 @@ class uCRM_VonMisesMassMin:
         self.assembler.evalAdjointResProduct(self.adjoint, product)
 
         # Set the constraint gradient
-        dfdx[:] = -(dfdx - product)/self.thickness_scale
+        dfdx -= product
+        dfdx *= -1.0/self.thickness_scale
 
         # Write out the solution file every 10 iterations
-        if self.iter_count % 10 == 0:
+        if self.write_output and self.iter_count % 10 == 0:
             self.f5.writeToFile('results/ucrm_iter%d.f5'%(self.iter_count))
         self.iter_count += 1
 
@@ -292,6 +308,11 @@ class CreateMe(TMR.QuadCreator):
         attr = topo.getFace(quad.face).getName()
         return self.elem_dict[order-2][attr]
 
+# The surface traction elements, indexed by mesh order. The traction is
+# the same on every element, so one instance per order is shared by
+# all elements and reused across the adaptive steps.
+traction_elems = {}
+
 def addFaceTraction(order, assembler):
     # Create the surface traction
     aux = TACS.AuxElements()
@@ -299,16 +320,18 @@ def addFaceTraction(order, assembler):
     # Get the element node locations
     nelems = assembler.getNumElements()
 
-    # Loop over the nodes and create the traction forces in the x/y/z
-    # directions
-    nnodes = order*order
-    tx = np.zeros(nnodes, dtype=TACS.dtype)
-    ty = np.zeros(nnodes, dtype=TACS.dtype)
-    tz = np.zeros(nnodes, dtype=TACS.dtype)
-    tz[:] = 5.0
+    if order not in traction_elems:
+        # Create the traction forces in the x/y/z directions. Only the
+        # z-component is non-zero, so the x/y components share one array.
+        nnodes = order*order
+        tzero = np.zeros(nnodes, dtype=TACS.dtype)
+        tz = np.full(nnodes, 5.0, dtype=TACS.dtype)
 
-    # Create the shell traction
-    trac = elements.ShellTraction(order, tx, ty, tz)
+        # Create the shell traction
+        traction_elems[order] = elements.ShellTraction(order, tzero,
+                                                       tzero, tz)
+
+    trac = traction_elems[order]
     for i in range(nelems):
         aux.addElement(i, trac)
 
@@ -342,7 +365,8 @@ def createProblemMg(topo, elem_dict, forest, bcs, ordering,
     forest.repartition()
     forests.append(forest)
 
-    # Make the creator class
+    # Make the creator class. The creator does not depend on the
+    # forest, so the same one is used for all multigrid levels.
     creator = CreateMe(bcs, topo, elem_dict)
     assemblers.append(creator.createTACS(forest, ordering))
 
@@ -353,8 +377,7 @@ def createProblemMg(topo, elem_dict, forest, bcs, ordering,
         forest.balance(1)
         forests.append(forest)
 
-        # Make the creator class
-        creator = CreateMe(bcs, topo, elem_dict)
+        # Create the assembler for the lower-order level
         assemblers.append(creator.createTACS(forest, ordering))
 
     # Create the multigrid object
@@ -374,6 +397,9 @@ p.add_argument('--ordering', type=str, default='multicolor')
 p.add_argument('--ksweight', type=float, default=10.0)
 p.add_argument('--element_count_target', type=float, default=20e3)
 p.add_argument('--optimizer', type=str, default='snopt')
+p.add_argument('--krylov_subspace', type=int, default=100)
+p.add_argument('--krylov_restarts', type=int, default=None)
+p.add_argument('--write_all_steps', action='store_true', default=False)
 args = p.parse_args()
 
 # Set the KS parameter
@@ -445,6 +471,10 @@ ucrm_root_edges = [200, 380, 270, 220]
 
 ucrm_skins, ucrm_spars, ucrm_ribs = get_face_indices(faces)
 
+# Sets for fast membership tests
+ucrm_skins_set = frozenset(ucrm_skins)
+ucrm_ribs_set = frozenset(ucrm_ribs)
+
 # Get the face to face adjacency data structure
 face_to_face = get_face_to_face_index(faces, edges)
 
@@ -478,20 +508,22 @@ for i, f in enumerate(faces):
                           i, min_thickness, max_thickness)
 
     # Set the reference direction
-    if i in ucrm_ribs:
+    if i in ucrm_ribs_set:
         stiff.setRefAxis(rib_dir)
     else:
         stiff.setRefAxis(skin_spar_dir)
 
     # Set the component number for visualization purposes
     comp = 0
-    if i in ucrm_skins:
+    if i in ucrm_skins_set:
         comp = 1
-    elif i in ucrm_ribs:
+    elif i in ucrm_ribs_set:
         comp = 2
 
-    # Create the elements of different orders
-    for j in range(4):
+    # Create the elements of different orders. Only the orders that
+    # are used are needed: the analysis mesh, the refined mesh and the
+    # multigrid levels in between (orders 2 through order+1).
+    for j in range(order):
         elem_dict[j][attr] = elements.MITCShell(j+2, stiff,
                                                 component_num=comp)
 
@@ -544,9 +576,25 @@ elif ordering == 'multicolor':
 else:
     ordering = TACS.PY_NATURAL_ORDER
 
+# Set up the sparse linear constraint Jacobian. This only depends on
+# the face adjacency, so it is the same for every optimization. Each
+# row constrains the difference between a pair of adjacent faces.
+npairs = len(pairs)
+jac_rowp = np.arange(0, 2*npairs+1, 2, dtype=np.intc)
+jac_cols = np.array(pairs, dtype=np.intc).flatten()
+jac_data = np.tile([1.0, -1.0], npairs)
+jacobian = {'csr':[jac_rowp, jac_cols, jac_data],
+            'shape':[npairs, num_design_vars]}
+
 # Null pointer to the optimizer
 opt = None
 
+# The optimizer is only run on the odd steps. Find the last of these
+# so that its intermediate optimization output can be written.
+last_opt_step = steps-1
+if last_opt_step % 2 == 0:
+    last_opt_step -= 1
+
 for step in range(steps):
     # Create the assembler object and set the surface tractions
     assembler = createProblem(order, topo, elem_dict, forest, bcs)
@@ -564,6 +612,13 @@ for step in range(steps):
     # Set the new assembler object
     opt_problem.setAssembler(assembler, func)
 
+    # Only write the error histogram for the final step and the
+    # intermediate optimization output for the final optimization
+    # step, unless requested otherwise
+    write_output = (args.write_all_steps or step == steps-1)
+    opt_problem.write_output = (args.write_all_steps or
+                                step == last_opt_step)
+
     if step % 2 == 0:
         xdict = {'x': opt_problem.thickness_scale*opt_problem.x }
         # Solve the analysis problem at the first step
@@ -586,16 +641,6 @@ for step in range(steps):
         # Add the objective
         prob.addObj('objective')
 
-        # Set up the sparse constraint Jacobian
-        rowp = [0]
-        cols = []
-        data = []
-        for i, pair in enumerate(pairs):
-            data.extend([1.0, -1.0])
-            cols.extend([pair[0], pair[1]])
-            rowp.append(rowp[i] + 2)
-        jacobian = {'csr':[rowp, cols, data], 'shape':[len(pairs), n]}
-
         # Set the linear constraint Jacobian
         tscale = opt_problem.thickness_scale
         prob.addConGroup('lincon', len(pairs),
@@ -667,7 +712,11 @@ for step in range(steps):
     assembler_refined.evalSVSens(func_refined, adjoint_rhs)
     
     # Create the GMRES object on the fine mesh
-    gmres = TACS.KSM(mat, pc, 100, isFlexible=1)
+    if args.krylov_restarts is None:
+        gmres = TACS.KSM(mat, pc, args.krylov_subspace, isFlexible=1)
+    else:
+        gmres = TACS.KSM(mat, pc, args.krylov_subspace, isFlexible=1,
+                         nrestart=args.krylov_restarts)
     gmres.setMonitor(comm, freq=10)
     gmres.setTolerances(1e-14, 1e-30)
     
@@ -678,13 +727,7 @@ for step in range(steps):
     
     # Compute the adjoint correction on the fine mesh
     adjoint_corr = adjoint_refined.dot(res_refined)
-    
-    # Compute the adjoint correction
-    err_est, adjoint_corr, error =\
-             TMR.adjointError(forest, assembler,
-                              forest_refined, assembler_refined,
-                              ans_interp, adjoint_refined)
-    
+
     # Compute the reconstructed adjoint solution on the refined mesh
     adjoint = assembler.createVec()
     adjoint_interp = assembler_refined.createVec()
@@ -718,38 +761,22 @@ for step in range(steps):
     bins_per_decade = 10
     nbins = bins_per_decade*(high - low)
     bounds = 10**np.linspace(high, low, nbins+1)
-    bins = np.zeros(nbins+2, dtype=np.int)
 
-    # Compute the mean and standard deviations of the log(error)
-    err_est = comm.allreduce(np.sum(error), op=MPI.SUM)
-    ntotal = comm.allreduce(assembler.getNumElements(), op=MPI.SUM)
-    mean = comm.allreduce(np.sum(np.log(error)), op=MPI.SUM)
-    mean /= ntotal
+    # Compute the error estimate, the element and node counts and the
+    # mean and standard deviations of the log(error) from the sum and
+    # sum of squares, all reduced together in a single call
+    log_error = np.log(error)
+    sums = np.array([len(error), assembler.getNumOwnedNodes(),
+                     np.sum(error), np.sum(log_error),
+                     np.dot(log_error, log_error)])
+    comm.Allreduce(MPI.IN_PLACE, sums, op=MPI.SUM)
+    ntotal = int(sums[0])
+    nnodes = int(sums[1])
+    err_est = sums[2]
+    mean = sums[3]/ntotal
 
     # Compute the standard deviation
-    stddev = comm.allreduce(np.sum((np.log(error) - mean)**2), op=MPI.SUM)
-    stddev = np.sqrt(stddev/(ntotal-1))
-
-    # Get the total number of nodes
-    nnodes = comm.allreduce(assembler.getNumOwnedNodes(), op=MPI.SUM)
-
-    # Compute the bins
-    for i in range(len(error)):
-        if error[i] > bounds[0]:
-            bins[0] += 1
-        elif error[i] < bounds[-1]:
-            bins[-1] += 1
-        else:
-            for j in range(len(bounds)-1):
-                if (error[i] <= bounds[j] and
-                    error[i] > bounds[j+1]):
-                    bins[j+1] += 1
-
-    # Compute the number of bins
-    bins = comm.allreduce(bins, MPI.SUM)
-
-    # Compute the sum of the bins
-    total = np.sum(bins)
+    stddev = np.sqrt(max(sums[4] - ntotal*mean**2, 0.0)/(ntotal-1))
 
     # Print out the result
     if comm.rank == 0:
@@ -759,49 +786,61 @@ for step in range(steps):
         print('mean      = ', mean)
         print('stddev    = ', stddev)
 
-        # Set the data
-        data = np.zeros((nbins, 4))
-        for i in range(nbins-1, -1, -1):
-            data[i,0] = bounds[i]
-            data[i,1] = bounds[i+1]
-            data[i,2] = bins[i+1]
-            data[i,3] = 100.0*bins[i+1]/total
-        np.savetxt('results/crm_data%d.txt'%(step), data)
+    if write_output:
+        # Compute the bins: bins[0] holds errors above bounds[0], bins[-1]
+        # errors below bounds[-1] and bins[j+1] errors in the interval
+        # (bounds[j+1], bounds[j]]. The bounds are decreasing, so search
+        # the reversed (ascending) array.
+        index = np.searchsorted(bounds[::-1], error, side='left')
+        bins = np.bincount(nbins + 1 - index, minlength=nbins+2)
+
+        # Compute the number of bins
+        comm.Allreduce(MPI.IN_PLACE, bins, op=MPI.SUM)
+
+        # Compute the sum of the bins
+        total = np.sum(bins)
+
+        if comm.rank == 0:
+            # Set the data
+            data = np.zeros((nbins, 4))
+            data[:,0] = bounds[:-1]
+            data[:,1] = bounds[1:]
+            data[:,2] = bins[1:-1]
+            data[:,3] = 100.0*data[:,2]/total
+            np.savetxt('results/crm_data%d.txt'%(step), data)
 
     # Perform the refinement
     # Ensure that we're using an unstructured mesh
     opts.mesh_type_default = TMR.UNSTRUCTURED
 
-    # Find the positions of the center points of each node
-    nelems = assembler.getNumElements()
-    
-    # Allocate the positions
-    Xp = np.zeros((nelems, 3))
-    for i in range(nelems):
-        # Get the information about the given element
-        elem, Xpt, vrs, dvars, ddvars = assembler.getElementData(i)
-        
-        # Get the approximate element centroid
-        Xp[i,:] = np.average(Xpt.reshape((-1, 3)), axis=0)
+    # Find the positions of the center points of each element
+    Xp = TMR.getElementCentroids(assembler)
 
     # Prepare to collect things to the root processor (only one where
     # it is required)
     root = 0
 
+    # Pack the element errors and centroids so that they can be
+    # collected in a single message
+    size = error.shape[0]
+    elem_data = np.zeros((size, 4))
+    elem_data[:,0] = error
+    elem_data[:,1:] = Xp
+
     # Get the element counts
+    count = comm.gather(size, root=root)
     if comm.rank == root:
-        size = error.shape[0]
-        count = comm.gather(size, root=root)
-        count = np.array(count, dtype=np.int)
-        ntotal = np.sum(count)
-        
-        errors = np.zeros(np.sum(count))
-        Xpt = np.zeros(3*np.sum(count))
-        comm.Gatherv(error, [errors, count])
-        comm.Gatherv(Xp.flatten(), [Xpt, 3*count])
-        
-        # Reshape the point array
-        Xpt = Xpt.reshape(-1,3)
+        count = 4*np.array(count, dtype=np.intc)
+        displ = np.zeros(len(count), dtype=np.intc)
+        displ[1:] = np.cumsum(count)[:-1]
+
+        data = np.zeros((np.sum(count)//4, 4))
+        comm.Gatherv(elem_data, [data, count, displ, MPI.DOUBLE], root=root)
+        ntotal = data.shape[0]
+
+        # Extract the errors and the point array
+        errors = data[:,0]
+        Xpt = np.ascontiguousarray(data[:,1:])
 
         # Asymptotic order of accuracy on per-element basis
         s = 1.0
@@ -825,24 +864,17 @@ for step in range(steps):
 
         # Set the values of
         if feature_size is not None:
-            for i, hp in enumerate(hvals):
-                hlocal = feature_size.getFeatureSize(Xpt[i,:])
-                hvals[i] = np.min(
-                    (np.max((hp*hlocal, 0.25*hlocal)), 2*hlocal))
+            hlocal = feature_size.getFeatureSizes(Xpt)
+            hvals = np.clip(hvals*hlocal, 0.25*hlocal, 2*hlocal)
         else:
-            for i, hp in enumerate(hvals):
-                hvals[i] = np.min(
-                    (np.max((hp*htarget, 0.25*htarget)), 2*htarget))
+            hvals = np.clip(hvals*htarget, 0.25*htarget, 2*htarget)
 
         # Allocate the feature size object
         hmax = args.htarget
         hmin = 0.05*args.htarget
         feature_size = TMR.PointFeatureSize(Xpt, hvals, hmin, hmax)
     else:
-        size = error.shape[0]
-        comm.gather(size, root=root)
-        comm.Gatherv(error, None)
-        comm.Gatherv(Xp.flatten(), None)
+        comm.Gatherv(elem_data, None, root=root)
 
         # Create a dummy feature size object...
         feature_size = TMR.ConstElementSize(0.5*htarget)
@@ -1159,17 +1159,9 @@ for k in range(steps):
             # Ensure that we're using an unstructured mesh
             opts.mesh_type_default = TMR.UNSTRUCTURED
 
-            # Find the positions of the center points of each node
-            nelems = assembler.getNumElements()
-
-            # Allocate the positions
-            Xp = np.zeros((nelems, 3))
-            for i in range(nelems):
-                # Get the information about the given element
-                elem, Xpt, vrs, dvars, ddvars = assembler.getElementData(i)
-
-                # Get the approximate element centroid
-                Xp[i,:] = np.average(Xpt.reshape((-1, 3)), axis=0)
+            # Find the positions of the center points of each element
+            # from the average of the element node locations
+            Xp = TMR.getElementCentroids(assembler)
 
             # Prepare to collect things to the root processor (only
             # one where it is required)
@@ -1277,30 +1269,15 @@ for k in range(steps):
             forest.setMeshOrder(order, TMR.UNIFORM_POINTS)
             forest.createTrees(depth)
         else:
-            # The refinement array
-            refine = np.zeros(len(error), dtype=np.intc)
-
-            # Determine the cutoff values
-            cutoff = bins[-1]
-            bin_sum = 0
-            for i in range(len(bins)+1):
-                bin_sum += bins[i]
-                if bin_sum > 0.3*ntotal:
-                    cutoff = bounds[i]
-                    break
-
-            log_cutoff = np.log(cutoff)
+            # Determine the cutoff value: the bound of the first bin at
+            # which the cumulative element count exceeds 30% of the total
+            i = np.searchsorted(np.cumsum(bins), 0.3*ntotal, side='right')
+            cutoff = bounds[min(i, len(bounds)-1)]
 
             # Element target error is still too high. Adapt based solely
             # on decreasing the overall error
-            nrefine = 0
-            for i, err in enumerate(error):
-                # Compute the log of the error
-                logerr = np.log(err)
-
-                if logerr > log_cutoff:
-                    refine[i] = 1
-                    nrefine += 1
+            refine = np.array(error > cutoff, dtype=np.intc)
+            nrefine = np.sum(refine)
 
             # Refine the forest
             forest.refine(refine)
@@ -872,17 +872,9 @@ for k in range(steps):
             # Ensure that we're using an unstructured mesh
             opts.mesh_type_default = TMR.UNSTRUCTURED
 
-            # Find the positions of the center points of each node
-            nelems = assembler.getNumElements()
-
-            # Allocate the positions
-            Xp = np.zeros((nelems, 3))
-            for i in range(nelems):
-                # Get the information about the given element
-                elem, Xpt, vrs, dvars, ddvars = assembler.getElementData(i)
-
-                # Get the approximate element centroid
-                Xp[i,:] = np.average(Xpt.reshape((-1, 3)), axis=0)
+            # Find the positions of the center points of each element
+            # from the average of the element node locations
+            Xp = TMR.getElementCentroids(assembler)
 
             # Prepare to collect things to the root processor (only
             # one where it is required)
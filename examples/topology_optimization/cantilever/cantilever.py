@@ -80,25 +80,22 @@ class CreatorCallback:
             OctTopoCreator, OctForest: The creator and filter for this forest
         """
         filtr = forest.duplicate()
-        filtr.coarsen()
         creator = OctCreator(self.bcs, filtr, self.props)
         return creator, filtr
 
-def create_forest(comm, depth):
+def load_geometry(comm):
     """
-    Create an initial forest for analysis. and optimization
+    Load the geometry and create the mesh topology
 
     This code loads in the model, sets names, meshes the geometry and creates
-    a QuadForest from the mesh. The forest is populated with quadtrees with
-    the specified depth.
+    the topology from the mesh. None of this depends on the refinement, so it
+    only needs to be performed once.
 
     Args:
         comm (MPI_Comm): MPI communicator
-        depth (int): Depth of the initial trees
-        htarget (float): Target global element mesh size
 
     Returns:
-        OctForest: Initial forest for topology optimization
+        Model, Topology: The geometry model and the mesh topology
     """
     # Load the geometry model
     geo = TMR.LoadModel('cantilever.stp')
@@ -130,7 +127,23 @@ def create_forest(comm, depth):
     # Create the corresponding mesh topology from the mesh-model
     topo = TMR.Topology(comm, model)
 
-    # Create the quad forest and set the topology of the forest
+    return geo, topo
+
+def create_forest(comm, topo, depth):
+    """
+    Create an initial forest for analysis and optimization
+
+    The forest is populated with octrees with the specified depth.
+
+    Args:
+        comm (MPI_Comm): MPI communicator
+        topo (Topology): The mesh topology
+        depth (int): Depth of the initial trees
+
+    Returns:
+        OctForest: Initial forest for topology optimization
+    """
+    # Create the oct forest and set the topology of the forest
     forest = TMR.OctForest(comm)
     forest.setTopology(topo)
 
@@ -139,20 +152,20 @@ def create_forest(comm, depth):
 
     return forest
 
-def create_problem(forest, bcs, props, nlevels):
+def create_problem(forest, obj, m_fixed, nlevels):
     """
     Create the TMRTopoProblem object and set up the topology optimization problem.
 
-    This code is given the forest, boundary conditions, material properties and
-    the number of multigrid levels. Based on this info, it creates the TMRTopoProblem
-    and sets up the mass-constrained compliance minimization problem. Before
-    the problem class is returned it is initialized so that it can be used for
-    optimization.
+    This code is given the forest, the creator callback object, the mass
+    target and the number of multigrid levels. Based on this info, it creates
+    the TMRTopoProblem and sets up the mass-constrained compliance minimization
+    problem. Before the problem class is returned it is initialized so that it
+    can be used for optimization.
 
     Args:
         forest (OctForest): Forest object
-        bcs (BoundaryConditions): Boundary condition object
-        props (StiffnessProperties): Material properties object
+        obj (CreatorCallback): Creator callback for each mesh level
+        m_fixed (float): Fixed mass target
         nlevels (int): number of multigrid levels
 
     Returns:
@@ -160,7 +173,6 @@ def create_problem(forest, bcs, props, nlevels):
     """
 
     # Create the problem and filter object
-    obj = CreatorCallback(bcs, props)
     problem = TopOptUtils.createTopoProblem(forest,
         obj.creator_callback, filter_type, nlevels=nlevels)
 
@@ -169,22 +181,12 @@ def create_problem(forest, bcs, props, nlevels):
 
     # Set the load
     P = 1.0e3
-    force = TopOptUtils.computeVertexLoad('pt1', forest, assembler, [0, P, 0])
-    temp = TopOptUtils.computeVertexLoad('pt2', forest, assembler, [0, 0, P])
-    force.axpy(1.0, temp)
+    force = TopOptUtils.computeVertexLoads(['pt1', 'pt2'], forest, assembler,
+                                           [[0, P, 0], [0, 0, P]])
 
     # Set the load cases into the topology optimization problem
     problem.setLoadCases([force])
 
-    # Compute the fixed mass target
-    lx = 50.0 # mm
-    ly = 10.0 # mm
-    lz = 10.0 # mm
-    vol = lx*ly*lz
-    vol_frac = 0.25
-    density = 2600.0
-    m_fixed = vol_frac*(vol*density)
-
     # Set the mass constraint
     funcs = [functions.StructuralMass(assembler)]
     problem.addConstraints(0, funcs, [-m_fixed], [-1.0/m_fixed])
@@ -229,7 +231,8 @@ filter_type = 'lagrange'
 
 order = 2 # Order of the mesh
 nlevels = 4 # Number of multigrid levels
-forest = create_forest(comm, nlevels-1)
+geo, topo = load_geometry(comm)
+forest = create_forest(comm, topo, nlevels-1)
 
 # Set the boundary conditions for the problem
 bcs = TMR.BoundaryConditions()
@@ -242,14 +245,26 @@ E = [70e9]
 nu = [0.3]
 props = TMR.StiffnessProperties(rho, E, nu)
 
+# Create the callback that creates the discretization at each mesh level
+obj = CreatorCallback(bcs, props)
+
+# Compute the fixed mass target
+lx = 50.0 # mm
+ly = 10.0 # mm
+lz = 10.0 # mm
+vol = lx*ly*lz
+vol_frac = 0.25
+m_fixed = vol_frac*(vol*density)
+
 # Set the original filter to NULL
 orig_filter = None
 xopt = None
 
 max_iterations = 2
+max_refine = 1 # Maximum number of levels to refine at each step
 for step in range(max_iterations):
     # Create the problem
-    problem = create_problem(forest, bcs, props, nlevels)
+    problem = create_problem(forest, obj, m_fixed, nlevels)
     problem.setPrefix(prefix)
 
     # Extract the filter to interpolate design variables
@@ -269,7 +284,8 @@ for step in range(max_iterations):
 
     # Refine based solely on the value of the density variable
     assembler = problem.getAssembler()
-    TopOptUtils.densityBasedRefine(forest, assembler, lower=0.05, upper=0.5)
+    TopOptUtils.densityBasedRefine(forest, assembler, lower=0.05, upper=0.5,
+                                   max_refine=max_refine)
 
     # Repartition the mesh
     forest.repartition()
@@ -40,7 +40,6 @@ class CreatorCallback:
 
     def creator_callback(self, forest):
         filtr = forest.duplicate()
-        filtr.coarsen()
         creator = OctCreator(self.bcs, filtr, self.props)
         return creator, filtr
 
@@ -137,9 +136,8 @@ def create_problem(forest, bcs, props, nlevels):
 
     # Set the load
     P = 1.0e3
-    force = TopOptUtils.computeVertexLoad('pt1', forest, assembler, [0, P, 0])
-    temp = TopOptUtils.computeVertexLoad('pt2', forest, assembler, [0, 0, P])
-    force.axpy(1.0, temp)
+    force = TopOptUtils.computeVertexLoads(['pt1', 'pt2'], forest, assembler,
+                                           [[0, P, 0], [0, 0, P]])
 
     problem.setLoadCases([force])
 
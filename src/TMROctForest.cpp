@@ -1883,8 +1883,19 @@ void TMROctForest::createRandomTrees( int nrand,
 
 /*
   Repartition the octants across all processors
+
+  The octants are split into contiguous intervals along the
+  space-filling curve. When no weights are provided, each processor
+  receives an equal (or nearly equal) number of octants. Otherwise,
+  the intervals are chosen so that the sum of the weights on each
+  processor is nearly equal. Only the counts and the sums of the
+  weights are communicated to find the new intervals.
+
+  input:
+  max_rank:  the number of processors to distribute the octants over
+  weights:   optional non-negative weight for each local octant
 */
-void TMROctForest::repartition( int max_rank ){
+void TMROctForest::repartition( int max_rank, const int *weights ){
   const int num_blocks = bdata->num_blocks;
 
   // Free everything but the octants
@@ -1911,21 +1922,68 @@ void TMROctForest::repartition( int max_rank ){
     ptr[k+1] += ptr[k];
   }
 
-  // Compute the average size of the new counts
-  int average_count = ptr[mpi_size]/max_rank;
-  int remain = ptr[mpi_size] - average_count*max_rank;
-
   // Figure out what goes where on the new distribution of octants
   int *new_ptr = new int[ mpi_size+1 ];
   new_ptr[0] = 0;
-  for ( int k = 0; k < max_rank; k++ ){
-    new_ptr[k+1] = new_ptr[k] + average_count;
-    if (k < remain){
-      new_ptr[k+1] += 1;
+
+  if (weights){
+    // Compute the sum of the weights on this processor and the
+    // processors that precede it along the space-filling curve
+    double local_weight = 0.0;
+    for ( int i = 0; i < size; i++ ){
+      local_weight += weights[i];
+    }
+    double offset = 0.0, total_weight = 0.0;
+    MPI_Exscan(&local_weight, &offset, 1, MPI_DOUBLE, MPI_SUM, comm);
+    if (mpi_rank == 0){
+      offset = 0.0;
+    }
+    MPI_Allreduce(&local_weight, &total_weight, 1, MPI_DOUBLE,
+                  MPI_SUM, comm);
+
+    // Assign each local octant to a new owner based on the midpoint
+    // of its weighted interval. The owners are non-decreasing so
+    // that the new intervals remain contiguous.
+    int *counts = new int[ mpi_size ];
+    memset(counts, 0, mpi_size*sizeof(int));
+    for ( int i = 0; i < size; i++ ){
+      int owner = 0;
+      if (total_weight > 0.0){
+        double w = offset + 0.5*weights[i];
+        owner = (int)(max_rank*(w/total_weight));
+        if (owner >= max_rank){
+          owner = max_rank-1;
+        }
+      }
+      else {
+        owner = (int)((1.0*max_rank*(ptr[mpi_rank] + i))/ptr[mpi_size]);
+      }
+      counts[owner]++;
+      offset += weights[i];
+    }
+
+    // Sum up the number of octants sent to each processor
+    MPI_Allreduce(counts, &new_ptr[1], mpi_size, MPI_INT, MPI_SUM, comm);
+    delete [] counts;
+
+    for ( int k = 0; k < mpi_size; k++ ){
+      new_ptr[k+1] += new_ptr[k];
     }
   }
-  for ( int k = max_rank; k < mpi_size; k++ ){
-    new_ptr[k+1] = new_ptr[k];
+  else {
+    // Compute the average size of the new counts
+    int average_count = ptr[mpi_size]/max_rank;
+    int remain = ptr[mpi_size] - average_count*max_rank;
+
+    for ( int k = 0; k < max_rank; k++ ){
+      new_ptr[k+1] = new_ptr[k] + average_count;
+      if (k < remain){
+        new_ptr[k+1] += 1;
+      }
+    }
+    for ( int k = max_rank; k < mpi_size; k++ ){
+      new_ptr[k+1] = new_ptr[k];
+    }
   }
 
   // Allocate the new array of octants
@@ -2132,9 +2190,8 @@ void TMROctForest::refine( const int refinement[],
   // This is just a sanity check
   if (min_level > max_level){ min_level = max_level; }
 
-  // Create a hash table for the refined octants and the octants
-  // that are external (on other processors)
-  TMROctantHash *hash = new TMROctantHash();
+  // Create a hash table for the octants that are external (on other
+  // processors)
   TMROctantHash *ext_hash = new TMROctantHash();
 
   // Get the current array of octants
@@ -2142,11 +2199,44 @@ void TMROctForest::refine( const int refinement[],
   TMROctant *array;
   octants->getArray(&array, &size);
 
+  // Count the maximum number of new octants so that the locally
+  // owned octants can be written directly into their final array.
+  // Duplicates are removed when the array is sorted.
+  int max_local_size = 0;
+  if (refinement){
+    for ( int i = 0; i < size; i++ ){
+      if (refinement[i] > 0 && array[i].level < max_level){
+        int new_level = array[i].level + refinement[i];
+        if (new_level > max_level){
+          new_level = max_level;
+        }
+        int ref = new_level - array[i].level;
+        if (ref <= 0){
+          ref = 1;
+        }
+        else {
+          ref = 1 << (ref - 1);
+        }
+        max_local_size += ref*ref*ref;
+      }
+      else {
+        max_local_size++;
+      }
+    }
+  }
+  else {
+    max_local_size = size;
+  }
+
+  TMROctant *local_array = new TMROctant[ max_local_size ];
+  int local_size = 0;
+
   if (refinement){
     for ( int i = 0; i < size; i++ ){
       if (refinement[i] == 0){
         // We know that this octant is locally owned
-        hash->addOctant(&array[i]);
+        local_array[local_size] = array[i];
+        local_size++;
       }
       else if (refinement[i] < 0){
         // Coarsen this quadrant
@@ -2168,7 +2258,8 @@ void TMROctForest::refine( const int refinement[],
           oct.y = oct.y - (oct.y % h);
           oct.z = oct.z - (oct.z % h);
           if (mpi_rank == getOctantMPIOwner(&oct)){
-            hash->addOctant(&oct);
+            local_array[local_size] = oct;
+            local_size++;
           }
           else {
             ext_hash->addOctant(&oct);
@@ -2176,7 +2267,8 @@ void TMROctForest::refine( const int refinement[],
         }
         else {
           // If it is already at the min level, just add it
-          hash->addOctant(&array[i]);
+          local_array[local_size] = array[i];
+          local_size++;
         }
       }
       else if (refinement[i] > 0){
@@ -2214,7 +2306,8 @@ void TMROctForest::refine( const int refinement[],
                 oct.y = y + 2*jj*h;
                 oct.z = z + 2*kk*h;
                 if (mpi_rank == getOctantMPIOwner(&oct)){
-                  hash->addOctant(&oct);
+                  local_array[local_size] = oct;
+                  local_size++;
                 }
                 else {
                   ext_hash->addOctant(&oct);
@@ -2226,7 +2319,8 @@ void TMROctForest::refine( const int refinement[],
         else {
           // If the octant is at the max level add it without
           // refinement
-          hash->addOctant(&array[i]);
+          local_array[local_size] = array[i];
+          local_size++;
         }
       }
     }
@@ -2241,14 +2335,16 @@ void TMROctForest::refine( const int refinement[],
         oct.info = 0;
         oct.getSibling(0, &oct);
         if (mpi_rank == getOctantMPIOwner(&oct)){
-          hash->addOctant(&oct);
+          local_array[local_size] = oct;
+          local_size++;
         }
         else {
           ext_hash->addOctant(&oct);
         }
       }
       else {
-        hash->addOctant(&array[i]);
+        local_array[local_size] = array[i];
+        local_size++;
       }
     }
   }
@@ -2262,23 +2358,20 @@ void TMROctForest::refine( const int refinement[],
   delete ext_hash;
 
   // Get the local list octants added from other processors
-  // and add them to the local hash table
   TMROctantArray *local = distributeOctants(list);
   delete list;
 
-  // Get the local octants and add them to the hash table
+  // Create the new array and uniquely sort it. Merge in the
+  // octants from other processors, if any.
+  octants = new TMROctantArray(local_array, local_size);
+  octants->sort();
   local->getArray(&array, &size);
-  for ( int i = 0; i < size; i++ ){
-    hash->addOctant(&array[i]);
+  if (size > 0){
+    octants->merge(local);
+    octants->sort();
   }
   delete local;
 
-  // Cover the hash table to a list and uniquely sort it
-  octants = hash->toArray();
-  octants->sort();
-
-  delete hash;
-
   // Get the octants and order their labels
   octants->getArray(&array, &size);
   for ( int i = 0; i < size; i++ ){
@@ -80,9 +80,9 @@ class TMROctForest : public TMREntity {
   int getMeshOrder();
   TMRInterpolationType getInterpType();
 
-  // Re-partition the octrees based on element count
-  // -----------------------------------------------
-  void repartition( int max_rank=-1 );
+  // Re-partition the octrees based on element count or weight
+  // ---------------------------------------------------------
+  void repartition( int max_rank=-1, const int *weights=NULL );
 
   // Create the forest of octrees
   // ----------------------------
@@ -339,6 +339,148 @@ static int compare_nodes( const void *a, const void *b ){
   return ao->compareNode(bo);
 }
 
+/*
+  Spread the lower 21 bits of the input so that there are two zero
+  bits between each of the original bits
+*/
+static inline uint64_t spread_bits( uint64_t v ){
+  v &= 0x1fffff;
+  v = (v | v << 32) & 0x1f00000000ffffULL;
+  v = (v | v << 16) & 0x1f0000ff0000ffULL;
+  v = (v | v << 8) & 0x100f00f00f00f00fULL;
+  v = (v | v << 4) & 0x10c30c30c30c30c3ULL;
+  v = (v | v << 2) & 0x1249249249249249ULL;
+  return v;
+}
+
+/*
+  Sort the octants using a least-significant digit radix sort
+
+  Each octant is assigned a 128-bit key that consists of the block,
+  the interleaved (Morton) bits of the x, y and z coordinates, and
+  the level, from most to least significant. This produces the same
+  ordering as compare_octants. The keys are sorted with 8-bit digits,
+  or 16-bit digits for large arrays, and passes where all the octants
+  share the same digit are skipped.
+
+  input:
+  array:   the array of octants
+  size:    the number of octants
+
+  returns:
+  1 if the octants were sorted, 0 if the octants could not be encoded
+*/
+static int radix_sort_octants( TMROctant *array, int size ){
+  const int32_t hmax = 1 << TMR_MAX_LEVEL;
+
+  // Check that all the octants can be encoded in the key
+  for ( int i = 0; i < size; i++ ){
+    if (array[i].block < 0 ||
+        array[i].x < 0 || array[i].x >= hmax ||
+        array[i].y < 0 || array[i].y >= hmax ||
+        array[i].z < 0 || array[i].z >= hmax ||
+        array[i].level < 0 || array[i].level > TMR_MAX_LEVEL){
+      return 0;
+    }
+  }
+
+  // Compute the keys: the low word is stored first
+  uint64_t *keys = new uint64_t[ 4*size ];
+  int *perm = new int[ 2*size ];
+  for ( int i = 0; i < size; i++ ){
+    uint64_t x = array[i].x, y = array[i].y, z = array[i].z;
+
+    // Interleave the upper and lower 15 bits of the coordinates
+    uint64_t mhi = ((spread_bits(x >> 15) << 2) |
+                    (spread_bits(y >> 15) << 1) |
+                    spread_bits(z >> 15));
+    uint64_t mlo = ((spread_bits(x & 0x7fff) << 2) |
+                    (spread_bits(y & 0x7fff) << 1) |
+                    spread_bits(z & 0x7fff));
+
+    // key = block << 95 | mhi << 50 | mlo << 5 | level
+    keys[2*i] = ((uint64_t)array[i].level | (mlo << 5) | (mhi << 50));
+    keys[2*i+1] = ((mhi >> 14) | ((uint64_t)array[i].block << 31));
+    perm[i] = i;
+  }
+
+  // Use 16-bit digits for large arrays. For smaller arrays, the cost
+  // of clearing and scanning 65536 buckets on each pass dominates, so
+  // use 8-bit digits instead.
+  const int nbits = (size < 16384 ? 8 : 16);
+  const int npasses = 128/nbits;
+  const int nbuckets = 1 << nbits;
+  const uint64_t mask = nbuckets-1;
+  int *count = new int[ nbuckets ];
+
+  uint64_t *src_keys = keys, *dest_keys = &keys[2*size];
+  int *src_perm = perm, *dest_perm = &perm[size];
+
+  for ( int pass = 0; pass < npasses; pass++ ){
+    const int word = pass/(npasses/2);
+    const int shift = nbits*(pass % (npasses/2));
+
+    // Count the number of octants with each digit
+    memset(count, 0, nbuckets*sizeof(int));
+    for ( int i = 0; i < size; i++ ){
+      count[(src_keys[2*i+word] >> shift) & mask]++;
+    }
+
+    // Skip this pass if all the digits are the same
+    int digit = (src_keys[word] >> shift) & mask;
+    if (count[digit] == size){
+      continue;
+    }
+
+    // Compute the offsets for each digit
+    for ( int k = 0, offset = 0; k < nbuckets; k++ ){
+      int tmp = count[k];
+      count[k] = offset;
+      offset += tmp;
+    }
+
+    // Scatter the keys in a stable manner
+    for ( int i = 0; i < size; i++ ){
+      int pos = count[(src_keys[2*i+word] >> shift) & mask]++;
+      dest_keys[2*pos] = src_keys[2*i];
+      dest_keys[2*pos+1] = src_keys[2*i+1];
+      dest_perm[pos] = src_perm[i];
+    }
+
+    // Swap the source and destination
+    uint64_t *tkeys = src_keys;
+    src_keys = dest_keys;
+    dest_keys = tkeys;
+    int *tperm = src_perm;
+    src_perm = dest_perm;
+    dest_perm = tperm;
+  }
+
+  // Apply the permutation to the octants in place by following each
+  // cycle, so that no temporary copy of the octants is required. The
+  // permutation entries are reset to their own index once placed.
+  for ( int i = 0; i < size; i++ ){
+    if (src_perm[i] != i){
+      TMROctant t = array[i];
+      int j = i;
+      while (src_perm[j] != i){
+        int k = src_perm[j];
+        array[j] = array[k];
+        src_perm[j] = j;
+        j = k;
+      }
+      array[j] = t;
+      src_perm[j] = j;
+    }
+  }
+
+  delete [] count;
+  delete [] keys;
+  delete [] perm;
+
+  return 1;
+}
+
 /*
   Store a array of octants
 */
@@ -398,7 +540,11 @@ void TMROctantArray::sort(){
     size = j;
   }
   else {
-    qsort(array, size, sizeof(TMROctant), compare_octants);
+    // Use the radix sort unless the array is small, falling back to
+    // the comparison sort if the octants cannot be encoded
+    if (size < 512 || !radix_sort_octants(array, size)){
+      qsort(array, size, sizeof(TMROctant), compare_octants);
+    }
 
     // Now that the Octants are sorted, remove duplicates
     int i = 0; // Location from which to take entries
@@ -2822,6 +2822,92 @@ void TMR_PrintErrorBins( MPI_Comm comm,
   }
 }
 
+/*
+  Compute the centroid of each local element in the assembler
+
+  The centroid is approximated by the average of the element node
+  locations. Only the nodes of each element are included, so meshes
+  with different numbers of nodes per element are handled correctly.
+
+  input:
+  tacs:    the TACSAssembler object
+
+  output:
+  Xc:      the element centroids (3 entries per element)
+*/
+void TMR_GetElementCentroids( TACSAssembler *tacs, double *Xc ){
+  const int nelems = tacs->getNumElements();
+  const int max_nodes = tacs->getMaxElementNodes();
+
+  TacsScalar *X = new TacsScalar[ 3*max_nodes ];
+  for ( int elem = 0; elem < nelems; elem++ ){
+    int len = 0;
+    const int *nodes;
+    tacs->getElement(elem, &nodes, &len);
+    tacs->getElement(elem, X);
+
+    double *xc = &Xc[3*elem];
+    xc[0] = xc[1] = xc[2] = 0.0;
+    for ( int k = 0; k < len; k++ ){
+      xc[0] += TacsRealPart(X[3*k]);
+      xc[1] += TacsRealPart(X[3*k+1]);
+      xc[2] += TacsRealPart(X[3*k+2]);
+    }
+    if (len > 0){
+      xc[0] /= len;
+      xc[1] /= len;
+      xc[2] /= len;
+    }
+  }
+  delete [] X;
+}
+
+/*
+  Evaluate the design-dependent output value for every element
+
+  The value is evaluated at the parametric origin of each element
+  using the constitutive object. Elements without a constitutive
+  object are flagged so that the caller can skip them.
+
+  input:
+  tacs:     the TACSAssembler object
+  index:    the index passed to getDVOutputValue
+
+  output:
+  values:   the output value for each element
+  defined:  flag indicating whether the element has a value
+
+  returns:
+  the number of elements with a value
+*/
+int TMR_GetElementDVOutputValues( TACSAssembler *tacs, int index,
+                                  double *values, int *defined ){
+  const int nelems = tacs->getNumElements();
+  TACSElement **elements = tacs->getElements();
+
+  // Evaluate the values at the parametric origin
+  const double pt[3] = {0.0, 0.0, 0.0};
+
+  int count = 0;
+  for ( int elem = 0; elem < nelems; elem++ ){
+    TACSConstitutive *con = NULL;
+    if (elements[elem]){
+      con = elements[elem]->getConstitutive();
+    }
+    if (con){
+      values[elem] = TacsRealPart(con->getDVOutputValue(index, pt));
+      defined[elem] = 1;
+      count++;
+    }
+    else {
+      values[elem] = 0.0;
+      defined[elem] = 0;
+    }
+  }
+
+  return count;
+}
+
 /*!
   Create a nodal vector from the forest
 */
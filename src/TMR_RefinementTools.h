@@ -82,6 +82,17 @@ void TMR_PrintErrorBins( MPI_Comm comm, const double *error,
                          const int nelems, double *mean=NULL,
                          double *stddev=NULL );
 
+/*
+  Compute the centroids of all elements in the assembler
+*/
+void TMR_GetElementCentroids( TACSAssembler *tacs, double *Xc );
+
+/*
+  Evaluate the design-dependent output value for all elements
+*/
+int TMR_GetElementDVOutputValues( TACSAssembler *tacs, int index,
+                                  double *values, int *defined );
+
 /*
   Perform a mesh refinement based on the strain engery refinement
   criteria.
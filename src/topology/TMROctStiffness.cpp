@@ -49,6 +49,7 @@ TMROctStiffness::TMROctStiffness( TMRIndexWeight *_weights,
       rho[j] = 1.0/(nvars-1);
     }
   }
+  computePenalty();
 }
 
 /*
@@ -83,6 +84,43 @@ void TMROctStiffness::setDesignVars( const TacsScalar xdv[], int numDVs ){
       rho[j] = x[j];
     }
   }
+
+  computePenalty();
+}
+
+/*
+  Compute the RAMP penalty and its derivative with respect to the
+  design variable
+
+  The density only changes when the design variables are set, so the
+  penalty is evaluated once here instead of at every quadrature point
+  in calculateStress and addStressDVSens. The parameters are stored so
+  that updatePenalty() can detect a change to the properties.
+*/
+void TMROctStiffness::computePenalty(){
+  const double q = props->q;
+  const double beta = props->beta;
+  const double xoffset = props->xoffset;
+  const int use_project = props->use_project;
+
+  penalty_q = q;
+  penalty_beta = beta;
+  penalty_xoffset = xoffset;
+  penalty_use_project = use_project;
+
+  for ( int j = 0; j < nvars; j++ ){
+    TacsScalar d = 1.0/(1.0 + q*(1.0 - rho[j]));
+    penalty[j] = rho[j]*d;
+
+    // Compute the derivative of the penalization with respect to
+    // the projected density
+    dpenalty[j] = (q + 1.0)*d*d;
+
+    // Add the derivative of the projection
+    if (use_project){
+      dpenalty[j] *= beta*exp(-beta*(x[j] - xoffset))*rho[j]*rho[j];
+    }
+  }
 }
 
 /*
@@ -146,19 +184,17 @@ void TMROctStiffness::calculateStress( const double pt[],
                                        const TacsScalar e[],
                                        TacsScalar s[] ){
   const double k0 = props->k0;
-  const double q = props->q;
+  updatePenalty();
 
   if (nvars == 1){
-    // Compute the penalized stiffness
-    TacsScalar penalty = rho[0]/(1.0 + q*(1.0 - rho[0]));
-
     // Extract the properties
     TacsScalar nu = props->nu[0];
     TacsScalar D = props->D[0];
     TacsScalar G = props->G[0];
 
-    TacsScalar Dp = (penalty + k0)*D;
-    TacsScalar Gp = (penalty + k0)*G;
+    // Compute the penalized stiffness
+    TacsScalar Dp = (penalty[0] + k0)*D;
+    TacsScalar Gp = (penalty[0] + k0)*G;
     s[0] = Dp*((1.0 - nu)*e[0] + nu*(e[1] + e[2]));
     s[1] = Dp*((1.0 - nu)*e[1] + nu*(e[0] + e[2]));
     s[2] = Dp*((1.0 - nu)*e[2] + nu*(e[0] + e[1]));
@@ -170,17 +206,14 @@ void TMROctStiffness::calculateStress( const double pt[],
     // Compute the penalized stiffness
     s[0] = s[1] = s[2] = s[3] = s[4] = s[5] = 0.0;
     for ( int j = 1; j < nvars; j++ ){
-      // Compute the penalty
-      TacsScalar penalty = rho[j]/(1.0 + q*(1.0 - rho[j]));
-
       // Extract the properties
       TacsScalar nu = props->nu[j-1];
       TacsScalar D = props->D[j-1];
       TacsScalar G = props->G[j-1];
 
       // Add the penalized value
-      TacsScalar Dp = (penalty + k0)*D;
-      TacsScalar Gp = (penalty + k0)*G;
+      TacsScalar Dp = (penalty[j] + k0)*D;
+      TacsScalar Gp = (penalty[j] + k0)*G;
       s[0] += Dp*((1.0 - nu)*e[0] + nu*(e[1] + e[2]));
       s[1] += Dp*((1.0 - nu)*e[1] + nu*(e[0] + e[2]));
       s[2] += Dp*((1.0 - nu)*e[2] + nu*(e[0] + e[1]));
@@ -200,29 +233,15 @@ void TMROctStiffness::addStressDVSens( const double pt[],
                                        TacsScalar alpha,
                                        const TacsScalar psi[],
                                        TacsScalar fdvSens[], int dvLen ){
-  const double q = props->q;
-  const double beta = props->beta;
-  const double xoffset = props->xoffset;
-  const int use_project = props->use_project;
-
+  updatePenalty();
   if (nvars == 1){
-    // Compute the derivative of the penalization with respect to
-    // the projected density
-    TacsScalar penalty =
-      (q + 1.0)/((1.0 + q*(1.0 - rho[0]))*(1.0 + q*(1.0 - rho[0])));
-
-    // Add the derivative of the projection
-    if (use_project){
-      penalty *= beta*exp(-beta*(x[0] - xoffset))*rho[0]*rho[0];
-    }
-
     // Extract the properties
     TacsScalar nu = props->nu[0];
     TacsScalar D = props->D[0];
     TacsScalar G = props->G[0];
 
-    TacsScalar Dp = alpha*penalty*D;
-    TacsScalar Gp = alpha*penalty*G;
+    TacsScalar Dp = alpha*dpenalty[0]*D;
+    TacsScalar Gp = alpha*dpenalty[0]*G;
     TacsScalar s[6];
     s[0] = Dp*((1.0 - nu)*e[0] + nu*(e[1] + e[2]));
     s[1] = Dp*((1.0 - nu)*e[1] + nu*(e[0] + e[2]));
@@ -239,24 +258,14 @@ void TMROctStiffness::addStressDVSens( const double pt[],
   }
   else {
     for ( int j = 1; j < nvars; j++ ){
-      // Compute the derivative of the penalization with respect to
-      // the projected density
-      TacsScalar penalty =
-        (q + 1.0)/((1.0 + q*(1.0 - rho[j]))*(1.0 + q*(1.0 - rho[j])));
-
-      // Add the derivative of the projection
-      if (use_project){
-        penalty *= beta*exp(-beta*(x[j] - xoffset))*rho[j]*rho[j];
-      }
-
       // Extract the properties
       TacsScalar nu = props->nu[j-1];
       TacsScalar D = props->D[j-1];
       TacsScalar G = props->G[j-1];
 
       // Add the result to the derivative
-      TacsScalar Dp = alpha*penalty*D;
-      TacsScalar Gp = alpha*penalty*G;
+      TacsScalar Dp = alpha*dpenalty[j]*D;
+      TacsScalar Gp = alpha*dpenalty[j]*G;
       TacsScalar s[6];
       s[0] = Dp*((1.0 - nu)*e[0] + nu*(e[1] + e[2]));
       s[1] = Dp*((1.0 - nu)*e[1] + nu*(e[0] + e[2]));
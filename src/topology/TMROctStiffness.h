@@ -161,6 +161,20 @@ class TMROctStiffness : public SolidStiffness {
   }
 
  private:
+  // Compute the penalty and its derivative from the density
+  void computePenalty();
+
+  // Recompute the penalty if q, beta, xoffset or use_project were
+  // changed in the properties after the design variables were set.
+  // The density itself is only updated by setDesignVars.
+  inline void updatePenalty(){
+    if (props->q != penalty_q || props->beta != penalty_beta ||
+        props->xoffset != penalty_xoffset ||
+        props->use_project != penalty_use_project){
+      computePenalty();
+    }
+  }
+
   // The stiffness properties
   TMRStiffnessProperties *props;
 
@@ -169,6 +183,14 @@ class TMROctStiffness : public SolidStiffness {
   TacsScalar x[MAX_NUM_MATERIALS+1];
   TacsScalar rho[MAX_NUM_MATERIALS+1];
 
+  // The RAMP penalty and its derivative w.r.t. the design variable
+  TacsScalar penalty[MAX_NUM_MATERIALS+1];
+  TacsScalar dpenalty[MAX_NUM_MATERIALS+1];
+
+  // The property values used to compute the penalty
+  double penalty_q, penalty_beta, penalty_xoffset;
+  int penalty_use_project;
+
   // The local density of the
   int nweights;
   TMRIndexWeight *weights;
@@ -401,7 +401,7 @@ cdef extern from "TMROctForest.h":
         TMRTopology* getTopology()
         void setConnectivity(int, const int*, int)
         void setFullConnectivity(int, int, int, const int*, const int*)
-        void repartition(int)
+        void repartition(int, const int*)
         void createTrees(int)
         void createRandomTrees(int, int, int)
         void refine(int*, int, int)
@@ -520,6 +520,8 @@ cdef extern from "TMR_RefinementTools.h":
     void TMR_ComputeReconSolution(TMRQuadForest*, TACSAssembler*,
                                   TMRQuadForest*, TACSAssembler*,
                                   TACSBVec*, TACSBVec*, int)
+    void TMR_GetElementCentroids(TACSAssembler*, double*)
+    int TMR_GetElementDVOutputValues(TACSAssembler*, int, double*, int*)
     double TMR_StrainEnergyErrorEst(TMRQuadForest*, TACSAssembler*,
                                     TMRQuadForest *, TACSAssembler*,
                                     double*)
@@ -2143,6 +2143,25 @@ cdef class ElementFeatureSize:
         pt.z = x[2]
         return self.ptr.getFeatureSize(pt)
 
+    def getFeatureSizes(self, np.ndarray[double, ndim=2, mode='c'] X):
+        """
+        Evaluate the feature size at each point in an (n,3) array
+        """
+        cdef int i = 0
+        cdef int npts = X.shape[0]
+        cdef TMRPoint pt
+        cdef np.ndarray[double, ndim=1, mode='c'] h = None
+        if X.shape[1] != 3:
+            errmsg = 'getFeatureSizes expecting point (n,3) array'
+            raise ValueError(errmsg)
+        h = np.zeros(npts, dtype=np.double)
+        for i in range(npts):
+            pt.x = X[i,0]
+            pt.y = X[i,1]
+            pt.z = X[i,2]
+            h[i] = self.ptr.getFeatureSize(pt)
+        return h
+
 cdef class ConstElementSize(ElementFeatureSize):
     def __cinit__(self, double h):
         self.ptr = new TMRElementFeatureSize(h)
@@ -3305,19 +3324,33 @@ cdef class OctForest:
         num_nodes = np.max(conn)+1
         self.ptr.setConnectivity(num_nodes, <int*>conn.data, num_blocks)
 
-    def repartition(self, int max_rank=-1):
+    def repartition(self, int max_rank=-1,
+                    np.ndarray[int, ndim=1, mode='c'] weights=None):
         """
-        repartition(self, max_rank=-1)
+        repartition(self, max_rank=-1, weights=None)
 
         Repartition the mesh across processors. This redistributes the elements
         so that there are an equal, or nearly equal, number of elements on each
-        processor.
+        processor. If weights are provided, the elements are instead distributed
+        so that the sum of the weights on each processor is nearly equal.
 
         Args:
             max_rank (int): Number of processors to distribute the mesh across.
             If negative, the mesh is distributed across all processors
+            weights (np.ndarray): Optional non-negative weight for each local octant
         """
-        self.ptr.repartition(max_rank)
+        cdef int size = 0
+        cdef TMROctantArray *octs = NULL
+        cdef TMROctant *array = NULL
+        cdef int *w = NULL
+        if weights is not None:
+            self.ptr.getOctants(&octs)
+            octs.getArray(&array, &size)
+            if weights.shape[0] != size:
+                errmsg = 'Expected weights array of length %d'%(size)
+                raise ValueError(errmsg)
+            w = <int*>weights.data
+        self.ptr.repartition(max_rank, w)
 
     def createTrees(self, int depth=0):
         """
@@ -4446,6 +4479,56 @@ def createMg(list assemblers, list forests, double omega=1.0,
         return _init_Mg(mg)
     return None
 
+def getElementCentroids(Assembler assembler):
+    """
+    getElementCentroids(assembler)
+
+    Compute the centroids of all local elements in a single call
+
+    Parameters
+    -----------
+    assembler: :class:`~TACS.Assembler`
+      Finite assembler class containing the elements
+
+    Returns
+    --------
+    Xc: array of double
+      Element centroids with shape (nelems, 3), computed as the average
+      of the node locations of each element
+    """
+    cdef int nelems = assembler.ptr.getNumElements()
+    cdef np.ndarray Xc = np.zeros((nelems, 3), dtype=np.double)
+    TMR_GetElementCentroids(assembler.ptr, <double*>Xc.data)
+    return Xc
+
+def getElementDVOutputValues(Assembler assembler, int index=0):
+    """
+    getElementDVOutputValues(assembler, index=0)
+
+    Evaluate the design-dependent output value of all local elements at the
+    parametric origin in a single call
+
+    Parameters
+    -----------
+    assembler: :class:`~TACS.Assembler`
+      Finite assembler class containing the elements
+    index: int
+      The index passed to getDVOutputValue
+
+    Returns
+    --------
+    values: array of double
+      The output value for each element
+    defined: array of bool
+      True for elements with a constitutive object
+    """
+    cdef int nelems = assembler.ptr.getNumElements()
+    cdef np.ndarray values = np.zeros(nelems, dtype=np.double)
+    cdef np.ndarray defined = np.zeros(nelems, dtype=np.intc)
+    TMR_GetElementDVOutputValues(assembler.ptr, index, <double*>values.data,
+                                 <int*>defined.data)
+    return values, defined.astype(bool)
+
 def strainEnergyError(forest, Assembler coarse,
                       forest_refined, Assembler refined):
     """
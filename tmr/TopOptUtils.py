@@ -154,21 +154,44 @@ def computeVertexLoad(name, forest, assembler, point_force):
     if vars_per_node != len(point_force):
         raise ValueError('Point force length must be equal to vars_per_node')
 
+    return computeVertexLoads([name], forest, assembler, [point_force])
+
+def computeVertexLoads(names, forest, assembler, point_forces):
+    """
+    Add loads at the vertices with each of the given names. This is equivalent to
+    summing the result of computeVertexLoad for each name, but assembles all the
+    loads into a single vector and reorders it once.
+
+    Args:
+        names (list): List of the vertex names where the loads will be added
+        forest (QuadForest or OctForest): Forest for the finite-element mesh
+        assembler (Assembler): TACSAssembler object for the finite-element problem
+        point_forces (np.ndarray): Array of point forces, one row for each name
+
+    Returns:
+        Vec: A force vector containing the point loads
+    """
+
+    # Get the number of variable per node from the assembler
+    vars_per_node = assembler.getVarsPerNode()
+    point_forces = np.atleast_2d(np.array(point_forces))
+    if point_forces.shape != (len(names), vars_per_node):
+        raise ValueError('Point forces must have shape (len(names), vars_per_node)')
+
     # Create the force vector and extract the array
     force = assembler.createVec()
-    force_array = force.getArray()
-
-    # Retrieve the node numbers from the forest
-    nodes = forest.getNodesWithName(name)
+    force_array = force.getArray().reshape(-1, vars_per_node)
 
     comm = assembler.getMPIComm()
     node_range = forest.getNodeRange()
+    start = node_range[comm.rank]
+    end = node_range[comm.rank+1]
 
-    # Add the point force into the force arrays
-    for node in nodes:
-        if ((node >= node_range[comm.rank]) and (node < node_range[comm.rank+1])):
-            index = node - node_range[comm.rank]
-            force_array[vars_per_node*index:vars_per_node*(index+1)] += point_force[:]
+    # Add the point forces for the locally owned nodes
+    for name, point_force in zip(names, point_forces):
+        nodes = np.array(forest.getNodesWithName(name), dtype=int)
+        nodes = nodes[(nodes >= start) & (nodes < end)]
+        np.add.at(force_array, nodes - start, point_force)
 
     # Match the ordering of the vector
     assembler.reorderVec(force)
@@ -250,18 +273,23 @@ def compute3DTractionLoad(name, forest, assembler, tr):
 
     return computeTractionLoad(name, forest, assembler, trac)
 
-def interpolateDesignVec(orig_filter, orig_vec, new_filter, new_vec):
+def createDesignVecInterp(orig_filter, orig_vec, new_filter, new_vec):
     """
-    This function interpolates a design vector from the original design space defined
-    on an OctForest or QuadForest and interpolates it to a new OctForest or QuadForest.
+    Create the interpolation from the original design space defined on an OctForest
+    or QuadForest to a new OctForest or QuadForest.
 
-    This function is used after a mesh adaptation step to get the new design space.
+    The interpolation only depends on the filters and the layout of the design
+    vectors, so it can be created once and passed to interpolateDesignVec for each
+    vector that needs to be interpolated between the same two design spaces.
 
     Args:
         orig_filter (OctForest or QuadForest): Original filter Oct or QuadForest object
         orig_vec (PVec): Design variables on the original mesh in a ParOpt.PVec
         new_filter (OctForest or QuadForest): New filter Oct or QuadForest object
-        new_vec (PVec): Design variables on the new mesh in a ParOpt.PVec (set on ouput)
+        new_vec (PVec): Design variables on the new mesh in a ParOpt.PVec
+
+    Returns:
+        VecInterp: The initialized interpolation object
     """
 
     # Convert the PVec class to TACSBVec
@@ -284,10 +312,43 @@ def interpolateDesignVec(orig_filter, orig_vec, new_filter, new_vec):
     new_filter.createInterpolation(orig_filter, interp)
     interp.initialize()
 
+    return interp
+
+def interpolateDesignVec(orig_filter, orig_vec, new_filter, new_vec, interp=None):
+    """
+    This function interpolates a design vector from the original design space defined
+    on an OctForest or QuadForest and interpolates it to a new OctForest or QuadForest.
+
+    This function is used after a mesh adaptation step to get the new design space.
+    If an interpolation created by createDesignVecInterp is provided, it is used
+    directly instead of being rebuilt.
+
+    Args:
+        orig_filter (OctForest or QuadForest): Original filter Oct or QuadForest object
+        orig_vec (PVec): Design variables on the original mesh in a ParOpt.PVec
+        new_filter (OctForest or QuadForest): New filter Oct or QuadForest object
+        new_vec (PVec): Design variables on the new mesh in a ParOpt.PVec (set on ouput)
+        interp (VecInterp): Optional interpolation between the two design spaces
+
+    Returns:
+        VecInterp: The interpolation object, which may be reused
+    """
+
+    if interp is None:
+        interp = createDesignVecInterp(orig_filter, orig_vec, new_filter, new_vec)
+
+    # Convert the PVec class to TACSBVec
+    orig_x = TMR.convertPVecToVec(orig_vec)
+    if orig_x is None:
+        raise ValueError('Original vector must be generated by TMR.TopoProblem')
+    new_x = TMR.convertPVecToVec(new_vec)
+    if new_x is None:
+        raise ValueError('New vector must be generated by TMR.TopoProblem')
+
     # Perform the interpolation
     interp.mult(orig_x, new_x)
 
-    return
+    return interp
 
 def addNaturalFrequencyConstraint(problem, omega_min, **kwargs):
     """
@@ -357,9 +418,70 @@ def addNaturalFrequencyConstraint(problem, omega_min, **kwargs):
 
     return
 
+def computeDensityRefinement(assembler, index=0, lower=0.05, upper=0.5,
+                             reverse=False, max_refine=1):
+    """
+    Compute the density-based refinement flags for each element.
+
+    The density is extracted from the constitutive object of each element. Elements
+    with a density below *lower* are flagged with -1 (coarsen) and elements with a
+    density above *upper* are flagged for refinement. If *reverse* is set, this
+    scheme is reversed so low design values are refined.
+
+    The number of refinement levels grows with the distance past the bound, so that
+    an element is refined by 1 + floor(log2(value/upper)) levels, up to *max_refine*.
+    This allows the forest to reach the target resolution in a single refine call,
+    followed by a single 2-to-1 balance, instead of one level per remesh.
+
+    For example, with upper=0.5 and max_refine=2, elements with a density in
+    [0.5, 1.0) are refined once and elements with a density of 1.0 or more are
+    refined twice, which produces eight times as many elements in the solid
+    regions as max_refine=1. The default of max_refine=1 gives the original
+    one-level behavior.
+
+    Args:
+        assembler (Assembler): The TACS.Assembler object
+        index (int): The index used in the call to getDVOutputValue
+        lower (float): the lower limit used for coarsening
+        upper (float): the upper limit used for refinement
+        reverse (bool): Reverse the refinement scheme
+        max_refine (int): Maximum number of levels to refine in one pass
+
+    Returns:
+        refine (np.ndarray): The refinement flag for each element
+    """
+
+    # Evaluate the density within each element at the parametric origin.
+    # Elements without a constitutive object are not refined.
+    values, defined = TMR.getElementDVOutputValues(assembler, index)
+    refine = np.zeros(len(values), dtype=np.int32)
+
+    # Set the ratio between the density and the refinement bound
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if reverse:
+            fine = defined & (values < upper) & (values <= lower)
+            coarse = defined & (values >= upper)
+            ratio = lower/values
+        else:
+            fine = defined & (values >= upper)
+            coarse = defined & (values < upper) & (values <= lower)
+            ratio = values/upper
+
+    # Compute the number of levels, limited to max_refine
+    levels = np.full(len(values), max_refine, dtype=np.int32)
+    finite = fine & np.isfinite(ratio) & (ratio > 0.0)
+    levels[finite] = np.minimum(max_refine,
+                                1 + np.floor(np.log2(ratio[finite])))
+
+    # Apply the refinement criteria
+    refine[fine] = levels[fine]
+    refine[coarse] = -1
+
+    return refine
+
 def densityBasedRefine(forest, assembler, index=0,
                        lower=0.05, upper=0.5, reverse=False,
-                       min_lev=0, max_lev=TMR.MAX_LEVEL):
+                       min_lev=0, max_lev=TMR.MAX_LEVEL, max_refine=1):
     """
     Apply a density-based refinement criteria.
 
@@ -379,37 +501,12 @@ def densityBasedRefine(forest, assembler, index=0,
         reverse (bool): Reverse the refinement scheme
         min_lev (int): Minimum refinement level
         max_lev (int): Maximum refinement level
+        max_refine (int): Maximum number of levels to refine in one pass
     """
 
-    # Create refinement array
-    num_elems = assembler.getNumElements()
-    refine = np.zeros(num_elems, dtype=np.int32)
-
-    # Get the elements from the Assembler object
-    elems = assembler.getElements()
-
-    # Set the parametric point where the density will be evaluated. Use the
-    # parametric origin within the element.
-    pt = np.zeros(3, dtype=float)
-
-    for i in range(num_elems):
-        # Extract the constitutive object from the element, if it is defined, otherwise
-        # skip the refinement.
-        c = elems[i].getConstitutive()
-        if c is not None:
-            value = c.getDVOutputValue(index, pt)
-
-            # Apply the refinement criteria
-            if reverse:
-                if value >= upper:
-                    refine[i] = -1
-                elif value <= lower:
-                    refine[i] = 1
-            else:
-                if value >= upper:
-                    refine[i] = 1
-                elif value <= lower:
-                    refine[i] = -1
+    refine = computeDensityRefinement(assembler, index=index, lower=lower,
+                                      upper=upper, reverse=reverse,
+                                      max_refine=max_refine)
 
     # Refine the forest
     forest.refine(refine, min_lev=min_lev, max_lev=max_lev)